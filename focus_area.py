@@ -8,11 +8,23 @@ Creates a dimmed or blackout overlay to help you focus on specific screen areas
 
 import os
 import sys
+import base64
 import ctypes
-import json
-import webbrowser
+import functools
+import itertools
+import logging
+import struct
+import subprocess
+import threading
 from pathlib import Path
 
+logger = logging.getLogger('focus_area')
+logger.setLevel(logging.DEBUG if os.environ.get("FOCUS_AREA_DEBUG") else logging.WARNING)
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_log_handler)
+logger.propagate = False
+
 print("Configuring Tcl/Tk environment...")
 
 is_frozen = getattr(sys, 'frozen', False)
@@ -48,28 +60,68 @@ else:
 print("Attempting to import tkinter...")
 
 import tkinter as tk
-from tkinter import colorchooser, messagebox, Menu, simpledialog
+from tkinter import messagebox, Menu, ttk
 
 print("[OK] Tkinter imported successfully!")
 
-try:
-    import pystray
-    from PIL import Image, ImageDraw
-    print("[OK] System tray support loaded (pystray)")
-    TRAY_AVAILABLE = True
-except ImportError as e:
-    print(f"[WARNING] System tray support not available: {e}")
-    print("[INFO] Install with: pip install pystray Pillow")
-    TRAY_AVAILABLE = False
+pystray = None
+Image = None
+ImageDraw = None
+TRAY_AVAILABLE = None
+_TRAY_ICON_CACHE = None
 
 print()
 
 
+_FONT_10 = ("Segoe UI", 10)
+_FONT_11 = ("Segoe UI", 11)
+
 SW_HIDE = 0
 SW_SHOW = 5
 
 DWMWA_USE_IMMERSIVE_DARK_MODE = 20
 
+MB_ICONERROR = 0x10
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _dwmapi = ctypes.WinDLL('dwmapi')
+    _shell32 = ctypes.WinDLL('shell32')
+
+    _GetConsoleWindow = _kernel32.GetConsoleWindow
+    _GetConsoleWindow.argtypes = []
+    _GetConsoleWindow.restype = wintypes.HWND
+
+    _ShowWindow = _user32.ShowWindow
+    _ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+    _ShowWindow.restype = wintypes.BOOL
+
+    _GetParent = _user32.GetParent
+    _GetParent.argtypes = [wintypes.HWND]
+    _GetParent.restype = wintypes.HWND
+
+    _DwmSetWindowAttribute = _dwmapi.DwmSetWindowAttribute
+    _DwmSetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, wintypes.LPCVOID, wintypes.DWORD]
+    _DwmSetWindowAttribute.restype = ctypes.c_long
+
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = wintypes.BOOL
+
+    _ShellExecuteW = _shell32.ShellExecuteW
+    _ShellExecuteW.argtypes = [
+        wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+        wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int
+    ]
+    _ShellExecuteW.restype = ctypes.c_ssize_t
+
+    _MessageBoxW = _user32.MessageBoxW
+    _MessageBoxW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT]
+    _MessageBoxW.restype = ctypes.c_int
+
 def set_dark_title_bar(window):
     """
     Set dark title bar for window using Windows DWM API
@@ -78,9 +130,9 @@ def set_dark_title_bar(window):
         window: Tkinter window (Tk or Toplevel)
     """
     try:
-        hwnd = ctypes.windll.user32.GetParent(window.winfo_id())
+        hwnd = _GetParent(window.winfo_id())
         value = ctypes.c_int(1)
-        ctypes.windll.dwmapi.DwmSetWindowAttribute(
+        _DwmSetWindowAttribute(
             hwnd,
             DWMWA_USE_IMMERSIVE_DARK_MODE,
             ctypes.byref(value),
@@ -91,29 +143,75 @@ def set_dark_title_bar(window):
 
 def get_console_window():
     """Get handle to console window"""
-    return ctypes.windll.kernel32.GetConsoleWindow()
+    return _GetConsoleWindow()
 
 def show_console():
     """Show the console window"""
     hwnd = get_console_window()
     if hwnd:
-        ctypes.windll.user32.ShowWindow(hwnd, SW_SHOW)
+        _ShowWindow(hwnd, SW_SHOW)
 
 def hide_console():
     """Hide the console window"""
     hwnd = get_console_window()
     if hwnd:
-        ctypes.windll.user32.ShowWindow(hwnd, SW_HIDE)
+        _ShowWindow(hwnd, SW_HIDE)
+
+
+def _load_tray():
+    """
+    Import the system tray dependencies on first use
+
+    pystray and Pillow are only needed once the tray icon is created, so they
+    are kept out of the startup import path.
+
+    Returns:
+        bool: True if system tray support is available
+    """
+    global pystray, Image, ImageDraw, TRAY_AVAILABLE
+
+    if TRAY_AVAILABLE is not None:
+        return TRAY_AVAILABLE
+
+    try:
+        import pystray
+        from PIL import Image, ImageDraw
+        print("[OK] System tray support loaded (pystray)")
+        TRAY_AVAILABLE = True
+    except ImportError as e:
+        print(f"[WARNING] System tray support not available: {e}")
+        print("[INFO] Install with: pip install pystray Pillow")
+        TRAY_AVAILABLE = False
+
+    return TRAY_AVAILABLE
+
+
+def show_native_error(title, message):
+    """
+    Show a native Windows error message box
+
+    Used before the Tk root exists, where a tkinter messagebox would
+    silently create a hidden default root window.
+    """
+    _MessageBoxW(None, message, title, MB_ICONERROR)
 
 
 def create_tray_icon():
     """
     Create a simple icon for the system tray
 
+    The icon never changes, so it is built once and the same image is
+    returned on later calls.
+
     Returns:
         PIL.Image: Icon image (64x64)
     """
-    if not TRAY_AVAILABLE:
+    global _TRAY_ICON_CACHE
+
+    if _TRAY_ICON_CACHE is not None:
+        return _TRAY_ICON_CACHE
+
+    if not _load_tray():
         return None
 
     width = 64
@@ -121,25 +219,13 @@ def create_tray_icon():
     icon_image = Image.new('RGB', (width, height), color='black')
     draw = ImageDraw.Draw(icon_image)
 
+    # The 3px red border already covers the corner markers, so two outlines
+    # produce the complete icon.
     draw.rectangle([8, 8, 56, 56], outline='red', width=3)
 
     draw.rectangle([20, 20, 44, 44], outline='white', width=2)
 
-    corner_length = 8
-    corner_width = 2
-
-    draw.rectangle([8, 8, 8 + corner_length, 8 + corner_width], fill='red')
-    draw.rectangle([8, 8, 8 + corner_width, 8 + corner_length], fill='red')
-
-    draw.rectangle([56 - corner_length, 8, 56, 8 + corner_width], fill='red')
-    draw.rectangle([56 - corner_width, 8, 56, 8 + corner_length], fill='red')
-
-    draw.rectangle([8, 56 - corner_width, 8 + corner_length, 56], fill='red')
-    draw.rectangle([8, 56 - corner_length, 8 + corner_width, 56], fill='red')
-
-    draw.rectangle([56 - corner_length, 56 - corner_width, 56, 56], fill='red')
-    draw.rectangle([56 - corner_width, 56 - corner_length, 56, 56], fill='red')
-
+    _TRAY_ICON_CACHE = icon_image
     return icon_image
 
 
@@ -148,7 +234,7 @@ def check_and_elevate_admin():
     print("Checking for administrator privileges...")
 
     try:
-        is_admin = ctypes.windll.shell32.IsUserAnAdmin()
+        is_admin = _IsUserAnAdmin()
     except Exception as e:
         print(f"Error checking admin status: {e}")
         is_admin = False
@@ -157,14 +243,14 @@ def check_and_elevate_admin():
         print("Not running as administrator. Requesting elevation...")
 
         script_path = os.path.abspath(sys.argv[0])
-        params = ' '.join([f'"{arg}"' for arg in sys.argv[1:]])
+        params = subprocess.list2cmdline([script_path] + sys.argv[1:])
 
         try:
-            ret = ctypes.windll.shell32.ShellExecuteW(
+            ret = _ShellExecuteW(
                 None,
                 "runas",
                 sys.executable,
-                f'"{script_path}" {params}',
+                params,
                 None,
                 1
             )
@@ -174,23 +260,81 @@ def check_and_elevate_admin():
                 sys.exit(0)
             else:
                 print(f"Elevation failed with return code: {ret}")
-                messagebox.showerror(
+                show_native_error(
                     "Elevation Failed",
                     "Failed to run with administrator privileges.\nThe application may not function correctly."
                 )
         except Exception as e:
             print(f"Error during elevation: {e}")
-            messagebox.showerror("Error", f"Failed to elevate: {e}")
+            show_native_error("Error", f"Failed to elevate: {e}")
     else:
         print("Running with administrator privileges.")
 
 
+def _encode_config(config):
+    """
+    Serialize the configuration dict to indented JSON bytes
+
+    Uses orjson when it is installed and falls back to the standard library.
+    Both are imported here so neither is loaded at startup.
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+
+    import json
+    return json.dumps(config, indent=2).encode('utf-8')
+
+def _pack_coords(coords_list):
+    """
+    Pack focus area rectangles into a base64 string
+
+    Each rectangle is stored as four little-endian int32 values (x1, y1, x2, y2).
+    """
+    values = [round(value) for value in itertools.chain.from_iterable(coords_list)]
+    return base64.b64encode(struct.pack(f'<{len(values)}i', *values)).decode('ascii')
+
+def _unpack_coords(packed):
+    """Unpack rectangles written by _pack_coords into a list of (x1, y1, x2, y2) tuples"""
+    raw = base64.b64decode(packed)
+    if len(raw) % 16:
+        raise ValueError(f"packed focus areas have {len(raw)} bytes, not a multiple of 16")
+    values = struct.unpack(f'<{len(raw) // 4}i', raw)
+    return [values[i:i + 4] for i in range(0, len(values), 4)]
+
+def _atomic_write(path, data):
+    """Write bytes to a temporary file next to path, then atomically replace path"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
 class FocusArea:
     """Represents a transparent focus area that can be moved and resized"""
 
     MIN_SIZE = 10
     BORDER_WIDTH = 2
     BORDER_COLOR = "#FF0000"
+    HANDLE_OFFSET = 12
+    MOVE_HANDLE_BUFFER = 4
+    # Half the hovered outline width plus the canvas closeenough of 1 pixel
+    HIT_MARGIN = (BORDER_WIDTH + 1) / 2 + 1
+
+    CURSOR_MAP = {
+        "nw": "size_nw_se",
+        "ne": "size_ne_sw",
+        "sw": "size_ne_sw",
+        "se": "size_nw_se",
+        "n": "size_ns",
+        "s": "size_ns",
+        "w": "size_we",
+        "e": "size_we",
+        "move": "fleur"
+    }
 
     current = None
 
@@ -202,8 +346,9 @@ class FocusArea:
         self.start_x = x
         self.start_y = y
 
+        self._coords = [x, y, x + width, y + height]
         self.rect_id = self.canvas.create_rectangle(
-            x, y, x + width, y + height,
+            *self._coords,
             fill=parent.transparency_key,
             outline=self.BORDER_COLOR,
             width=self.BORDER_WIDTH,
@@ -212,19 +357,17 @@ class FocusArea:
         print(f"Focus area filled with transparency key: {parent.transparency_key}")
 
         self.move_handle_size = 4
-        handle_x = x + width * 0.5
-        handle_y = y - 12
+        self._handle_coords = self._compute_handle_coords(*self._coords)
         self.move_handle_id = self.canvas.create_oval(
-            handle_x - self.move_handle_size,
-            handle_y - self.move_handle_size,
-            handle_x + self.move_handle_size,
-            handle_y + self.move_handle_size,
+            *self._handle_coords,
             fill="#8B00FF",
             outline="#6A00CC",
             width=2,
             tags="move_handle"
         )
-        self.canvas.tag_raise(self.move_handle_id)
+        self._group_tag = f"fa_{id(self)}"
+        self.canvas.addtag_withtag(self._group_tag, self.rect_id)
+        self.canvas.addtag_withtag(self._group_tag, self.move_handle_id)
         print(f"Created violet move handle (4px) 12px above top side, centered horizontally")
 
         self.drag_start_x = 0
@@ -233,6 +376,13 @@ class FocusArea:
         self.resize_mode = None
         self.resize_handle_size = 10
 
+        self._motion_pending = False
+        self._last_motion_event = None
+        self._motion_handler = None
+
+        self._hover_state = False
+        self._handle_hover_state = False
+
         self.bind_events()
 
     def bind_events(self):
@@ -253,27 +403,23 @@ class FocusArea:
 
     def get_resize_mode(self, event_x, event_y):
         """Determine if mouse is near edge/corner for resizing"""
-        coords = self.canvas.coords(self.rect_id)
-        if not coords or len(coords) < 4:
-            return None
+        x1, y1, x2, y2 = self._coords
 
-        x1, y1, x2, y2 = coords
-
-        width = x2 - x1
-        handle_x = x1 + width * 0.5
-        handle_y = y1 - 12
-        move_handle_buffer = 4
-
-        if (abs(event_x - handle_x) < self.move_handle_size + move_handle_buffer and
-            abs(event_y - handle_y) < self.move_handle_size + move_handle_buffer):
+        reach = self.move_handle_size + self.MOVE_HANDLE_BUFFER
+        if (abs(event_x - (x1 + x2) * 0.5) < reach and
+            abs(event_y - (y1 - self.HANDLE_OFFSET)) < reach):
             return "move"
 
         handle = self.resize_handle_size
+        dx1 = event_x - x1
+        dx2 = event_x - x2
+        dy1 = event_y - y1
+        dy2 = event_y - y2
 
-        near_left = abs(event_x - x1) < handle
-        near_right = abs(event_x - x2) < handle
-        near_top = abs(event_y - y1) < handle
-        near_bottom = abs(event_y - y2) < handle
+        near_left = -handle < dx1 < handle
+        near_right = -handle < dx2 < handle
+        near_top = -handle < dy1 < handle
+        near_bottom = -handle < dy2 < handle
 
         if near_top and near_left:
             return "nw"
@@ -296,22 +442,7 @@ class FocusArea:
 
     def update_cursor(self, resize_mode):
         """Update cursor based on resize mode"""
-        cursor_map = {
-            "nw": "size_nw_se",
-            "ne": "size_ne_sw",
-            "sw": "size_ne_sw",
-            "se": "size_nw_se",
-            "n": "size_ns",
-            "s": "size_ns",
-            "w": "size_we",
-            "e": "size_we",
-            "move": "fleur"
-        }
-        cursor = cursor_map.get(resize_mode, "arrow")
-        try:
-            self.canvas.config(cursor=cursor)
-        except:
-            pass
+        self.parent.set_canvas_cursor(self.CURSOR_MAP.get(resize_mode, "arrow"))
 
     def on_motion(self, event):
         """Update cursor when mouse moves over focus area"""
@@ -321,54 +452,90 @@ class FocusArea:
 
     def on_enter(self, event):
         """Handle mouse entering focus area"""
-        self.canvas.itemconfig(self.rect_id, outline="#FF3333", width=self.BORDER_WIDTH + 1)
+        if not self._hover_state:
+            self.canvas.itemconfig(self.rect_id, outline="#FF3333", width=self.BORDER_WIDTH + 1)
+            self._hover_state = True
 
     def on_leave(self, event):
         """Handle mouse leaving focus area"""
         if FocusArea.current == self:
             FocusArea.current = None
-        self.canvas.itemconfig(self.rect_id, outline=self.BORDER_COLOR, width=self.BORDER_WIDTH)
+        if self._hover_state:
+            self.canvas.itemconfig(self.rect_id, outline=self.BORDER_COLOR, width=self.BORDER_WIDTH)
+            self._hover_state = False
         if not self.is_dragging:
-            self.canvas.config(cursor="cross")
+            self.parent.set_canvas_cursor("cross")
 
     def on_handle_enter(self, event):
         """Handle mouse entering move handle"""
-        self.canvas.itemconfig(self.move_handle_id, fill="#AA00FF", outline="#8B00FF")
-        self.canvas.config(cursor="fleur")
+        if not self._handle_hover_state:
+            self.canvas.itemconfig(self.move_handle_id, fill="#AA00FF", outline="#8B00FF")
+            self._handle_hover_state = True
+        self.parent.set_canvas_cursor("fleur")
 
     def on_handle_leave(self, event):
         """Handle mouse leaving move handle"""
         if not self.is_dragging:
-            self.canvas.itemconfig(self.move_handle_id, fill="#8B00FF", outline="#6A00CC")
-            self.canvas.config(cursor="cross")
+            if self._handle_hover_state:
+                self.canvas.itemconfig(self.move_handle_id, fill="#8B00FF", outline="#6A00CC")
+                self._handle_hover_state = False
+            self.parent.set_canvas_cursor("cross")
 
     def on_handle_press(self, event):
         """Handle move handle press"""
-        print(f"Move handle pressed at ({event.x}, {event.y})")
+        logger.debug("Move handle pressed at (%s, %s)", event.x, event.y)
         self.drag_start_x = event.x
         self.drag_start_y = event.y
         self.is_dragging = True
         self.resize_mode = "move"
         FocusArea.current = self
 
+    def queue_motion(self, event, handler):
+        """Store the latest motion event and apply it once per idle cycle"""
+        self._last_motion_event = event
+        self._motion_handler = handler
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.canvas.after_idle(self._flush_motion)
+
+    def _flush_motion(self):
+        """Apply the most recent queued motion event, if any"""
+        if not self._motion_pending:
+            return
+        self._motion_pending = False
+        event = self._last_motion_event
+        self._last_motion_event = None
+        self._motion_handler(event)
+
     def on_handle_drag(self, event):
         """Handle move handle drag"""
-        if self.is_dragging:
-            dx = event.x - self.drag_start_x
-            dy = event.y - self.drag_start_y
+        self.queue_motion(event, self._apply_handle_drag)
 
-            self.canvas.move(self.rect_id, dx, dy)
-            self.canvas.move(self.move_handle_id, dx, dy)
+    def _apply_handle_drag(self, event):
+        """Move the focus area and its handle to follow the drag"""
+        if not self.is_dragging:
+            return
 
-            self.drag_start_x = event.x
-            self.drag_start_y = event.y
+        dx = event.x - self.drag_start_x
+        dy = event.y - self.drag_start_y
+
+        self.canvas.move(self._group_tag, dx, dy)
+        self._offset_coords(dx, dy)
+        hx1, hy1, hx2, hy2 = self._handle_coords
+        self._handle_coords = [hx1 + dx, hy1 + dy, hx2 + dx, hy2 + dy]
+
+        self.drag_start_x = event.x
+        self.drag_start_y = event.y
 
     def on_handle_release(self, event):
         """Handle move handle release"""
-        print(f"Move handle released at ({event.x}, {event.y})")
+        logger.debug("Move handle released at (%s, %s)", event.x, event.y)
+        self._flush_motion()
         self.is_dragging = False
         self.resize_mode = None
-        self.canvas.itemconfig(self.move_handle_id, fill="#8B00FF", outline="#6A00CC")
+        if self._handle_hover_state:
+            self.canvas.itemconfig(self.move_handle_id, fill="#8B00FF", outline="#6A00CC")
+            self._handle_hover_state = False
 
     def on_handle_right_click(self, event):
         """Handle right-click on move handle - delete this focus area"""
@@ -379,71 +546,79 @@ class FocusArea:
 
     def on_press(self, event):
         """Handle mouse button press"""
-        print(f"Focus area pressed at ({event.x}, {event.y})")
+        logger.debug("Focus area pressed at (%s, %s)", event.x, event.y)
         self.drag_start_x = event.x
         self.drag_start_y = event.y
         self.is_dragging = True
         self.resize_mode = self.get_resize_mode(event.x, event.y)
-        print(f"Resize mode: {self.resize_mode}")
+        logger.debug("Resize mode: %s", self.resize_mode)
 
     def on_drag(self, event):
         """Handle mouse drag for moving or resizing"""
-        if not self.is_dragging:
-            return
+        self.queue_motion(event, self._apply_drag)
 
-        coords = self.canvas.coords(self.rect_id)
-        if not coords or len(coords) < 4:
+    def _apply_drag(self, event):
+        """Move or resize the focus area to follow the drag"""
+        if not self.is_dragging:
             return
 
-        x1, y1, x2, y2 = coords
+        x1, y1, x2, y2 = self._coords
         dx = event.x - self.drag_start_x
         dy = event.y - self.drag_start_y
 
         if self.resize_mode == "move":
             self.canvas.move(self.rect_id, dx, dy)
+            self._offset_coords(dx, dy)
             self.drag_start_x = event.x
             self.drag_start_y = event.y
         elif self.resize_mode:
             new_x1, new_y1, new_x2, new_y2 = x1, y1, x2, y2
 
             if "n" in self.resize_mode:
-                new_y1 = event.y
+                new_y1 = min(event.y, y2 - self.MIN_SIZE)
             if "s" in self.resize_mode:
-                new_y2 = event.y
+                new_y2 = max(event.y, y1 + self.MIN_SIZE)
             if "w" in self.resize_mode:
-                new_x1 = event.x
+                new_x1 = min(event.x, x2 - self.MIN_SIZE)
             if "e" in self.resize_mode:
-                new_x2 = event.x
+                new_x2 = max(event.x, x1 + self.MIN_SIZE)
 
-            if new_x2 - new_x1 >= self.MIN_SIZE and new_y2 - new_y1 >= self.MIN_SIZE:
-                self.canvas.coords(self.rect_id, new_x1, new_y1, new_x2, new_y2)
-                self.update_handle_position()
-                self.drag_start_x = event.x
-                self.drag_start_y = event.y
+            self._coords = [new_x1, new_y1, new_x2, new_y2]
+            self.canvas.coords(self.rect_id, *self._coords)
+            self.update_handle_position()
+            self.drag_start_x = event.x
+            self.drag_start_y = event.y
 
     def on_release(self, event):
         """Handle mouse button release"""
-        print(f"Focus area released at ({event.x}, {event.y})")
+        logger.debug("Focus area released at (%s, %s)", event.x, event.y)
+        self._flush_motion()
         self.is_dragging = False
         self.resize_mode = None
-        self.canvas.config(cursor="cross")
+        self.parent.set_canvas_cursor("cross")
 
     def update_handle_position(self):
         """Update the position of the move handle 12px above top side, centered horizontally"""
-        coords = self.canvas.coords(self.rect_id)
-        if coords and len(coords) >= 4:
-            x1, y1, x2, y2 = coords
-            width = x2 - x1
-            handle_x = x1 + width * 0.5
-            handle_y = y1 - 12
-
-            self.canvas.coords(
-                self.move_handle_id,
-                handle_x - self.move_handle_size,
-                handle_y - self.move_handle_size,
-                handle_x + self.move_handle_size,
-                handle_y + self.move_handle_size
-            )
+        self._handle_coords = self._compute_handle_coords(*self._coords)
+        self.canvas.coords(self.move_handle_id, *self._handle_coords)
+
+    def _compute_handle_coords(self, x1, y1, x2, y2):
+        """Return the move handle bounding box for the given rectangle"""
+        handle_x = (x1 + x2) * 0.5
+        handle_y = y1 - self.HANDLE_OFFSET
+        size = self.move_handle_size
+        return [handle_x - size, handle_y - size, handle_x + size, handle_y + size]
+
+    def set_coords(self, x1, y1, x2, y2):
+        """Move and resize this focus area to the given rectangle"""
+        self._coords = [x1, y1, x2, y2]
+        self.canvas.coords(self.rect_id, *self._coords)
+        self.update_handle_position()
+
+    def _offset_coords(self, dx, dy):
+        """Shift the cached rectangle coordinates after a canvas move"""
+        x1, y1, x2, y2 = self._coords
+        self._coords = [x1 + dx, y1 + dy, x2 + dx, y2 + dy]
 
     def delete(self):
         """Delete this focus area"""
@@ -457,7 +632,76 @@ class FocusArea:
 
     def get_coords(self):
         """Get the coordinates of this focus area"""
-        return self.canvas.coords(self.rect_id)
+        return list(self._coords)
+
+
+_QUICK_START_TEXT = """Focus_Area - Quick Start Guide
+
+IMPORTANT TIP - START HERE:
+Press and hold SHIFT to temporarily see through the veil (55% transparency)
+This helps you see where to position your focus areas!
+
+HOW TO USE:
+- Click and drag on the dark area to create focus areas
+- Drag the VIOLET HANDLE (4px, top center, 12px above) to move focus areas
+- Drag edges or corners to resize focus areas
+- Right-click the violet handle to DELETE a focus area
+- Right-click the dimmed area to show menu
+- Double-click anywhere to pause/resume
+- Scroll mouse wheel to change opacity
+- Hold SHIFT key to peek through the veil temporarily
+- Look for Focus_Area in the system tray!
+
+DELETING FOCUS AREAS:
+- Right-click the violet move handle to delete instantly
+- Or click the violet handle first, then press Delete key
+- Or use menu: Delete All Focus Areas
+
+SYSTEM TRAY:
+- Click tray icon to show/hide the veil
+- Right-click tray icon for quick menu access
+- Access Quick Start and Exit from tray
+
+KEYBOARD SHORTCUTS:
+- Shift         : Hold to peek through (see underlying content)
+- Ctrl+Shift+X  : Pause (hide veil)
+- Escape        : Show menu
+- Delete        : Delete focus area (after clicking violet handle)
+
+MOUSE ACTIONS:
+- Left-click drag (empty area)    : Create focus area
+- Left-click drag (violet handle) : Move focus area
+- Left-click drag (edge/corner)   : Resize focus area
+- Right-click (violet handle)     : Delete focus area
+- Right-click (dimmed area)       : Show menu
+- Double-click                    : Pause/Resume
+- Mouse wheel                     : Change opacity
+
+TIP: Focus areas are transparent windows where
+you can see your actual content clearly while
+the rest of the screen remains dimmed.
+
+Look for the small violet circle (4px) on the TOP SIDE
+(centered horizontally, 12px above) - that's your move handle!
+
+PEEK THROUGH TIP: Hold Shift to temporarily make the veil
+more transparent (55%) so you can see where to position
+your focus areas!"""
+
+_GITHUB_URL = "https://github.com/Gabrieliam42"
+
+_ABOUT_PRELUDE = """Focus_Area for Windows
+Python Implementation
+Version: 1.0.0
+
+Developed by:
+Gabriel Mihai
+"""
+
+_ABOUT_POSTLUDE = """
+
+Focus_Area helps you focus on your current
+task by dimming other screen areas."""
 
 
 class Focus_AreaWindow:
@@ -468,11 +712,33 @@ class Focus_AreaWindow:
     MENU_ACTIVE_BG = "#3C3C3C"
     MENU_ACTIVE_FG = "#FFFFFF"
 
+    @property
+    def veil_opacity(self):
+        """Veil opacity (0.01-1.0)"""
+        return self._veil_opacity
+
+    @veil_opacity.setter
+    def veil_opacity(self, value):
+        self._veil_opacity = value
+        self._opacity_pct = round(value * 100)
+
+    @property
+    def peek_through_opacity(self):
+        """Opacity used while Shift is held (0.01-1.0)"""
+        return self._peek_through_opacity
+
+    @peek_through_opacity.setter
+    def peek_through_opacity(self, value):
+        self._peek_through_opacity = value
+        self._peek_pct = round(value * 100)
+
     def __init__(self):
         print("Initializing Focus_Area window...")
 
         self.root = tk.Tk()
         self.root.title("Focus_Area")
+        self._tk_call = self.root.tk.call
+        self._root_w = self.root._w
 
         self.config_file = os.path.join(os.getcwd(), "focus_area_config.json")
         print(f"Configuration file: {self.config_file}")
@@ -492,17 +758,29 @@ class Focus_AreaWindow:
         self.drawing_rect = None
         self.draw_start_x = 0
         self.draw_start_y = 0
+        self._motion_pending = False
+        self._last_motion_event = None
+        self._pending_delta = 0.0
+        self._delta_scheduled = False
+        self._current_alpha_byte = -1
+        self._config_slot_lock = threading.Lock()
+        self._pending_config = None
+        self._config_writer_running = False
 
         self.tray_icon = None
         self.tray_thread = None
 
         self.handle_right_clicked = False
+        self._main_menu = None
+        self._error_after_id = None
+        self._error_entry = None
 
         self.console_visible = False
         hide_console()
         print("Console hidden (use menu to show)")
 
         self.setup_window()
+        self.setup_styles()
         self.setup_canvas()
 
         print("Making window visible...")
@@ -511,7 +789,7 @@ class Focus_AreaWindow:
         self.root.lift()
         self.root.attributes('-topmost', True)
         self.root.focus_force()
-        self.root.update()
+        self.root.update_idletasks()
         print("Window is now visible")
 
         self.setup_keybindings()
@@ -529,6 +807,11 @@ class Focus_AreaWindow:
 
         print(f"Screen dimensions: {screen_width}x{screen_height}")
 
+        # Cached once: the overlay is sized to the screen at startup and is not
+        # resized afterwards, so dialogs are centered on the same screen size
+        self._screen_w = screen_width
+        self._screen_h = screen_height
+
         self.root.geometry(f"{screen_width}x{screen_height}+0+0")
 
         self.root.overrideredirect(True)
@@ -544,6 +827,14 @@ class Focus_AreaWindow:
 
         print("Window properties configured")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _centered_geom(width, height, screen_w, screen_h):
+        """Return a Tk geometry string that centers a width x height window on the screen"""
+        x = (screen_w // 2) - (width // 2)
+        y = (screen_h // 2) - (height // 2)
+        return f'{width}x{height}+{x}+{y}'
+
     def setup_canvas(self):
         """Setup the canvas for drawing focus areas"""
         print("Setting up canvas...")
@@ -554,8 +845,18 @@ class Focus_AreaWindow:
             highlightthickness=0,
             cursor="cross"
         )
+        self._last_cursor = "cross"
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
+        self.drawing_rect = self.canvas.create_rectangle(
+            0, 0, 0, 0,
+            fill=self.transparency_key,
+            outline=FocusArea.BORDER_COLOR,
+            width=FocusArea.BORDER_WIDTH,
+            tags="drawing",
+            state="hidden"
+        )
+
         self.canvas.bind("<Button-1>", self.on_canvas_press)
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
@@ -608,15 +909,13 @@ class Focus_AreaWindow:
 
     def setup_tray_icon(self):
         """Setup system tray icon"""
-        if not TRAY_AVAILABLE:
+        if not _load_tray():
             print("[INFO] System tray icon not available (pystray not installed)")
             return
 
         print("Setting up system tray icon...")
 
         try:
-            import threading
-
             icon_image = create_tray_icon()
 
             menu = pystray.Menu(
@@ -675,20 +974,49 @@ class Focus_AreaWindow:
         """Quit application from tray"""
         self.root.after(0, self.quit_application)
 
+    def set_canvas_cursor(self, cursor):
+        """Set the canvas cursor, skipping the Tk call when it is already active"""
+        if cursor == self._last_cursor:
+            return
+        try:
+            self.canvas.config(cursor=cursor)
+            self._last_cursor = cursor
+        except tk.TclError:
+            pass
+
+    def find_focus_area_at(self, x, y):
+        """
+        Return the topmost focus area whose rectangle or move handle contains (x, y)
+
+        Both boxes are widened by FocusArea.HIT_MARGIN so a click on the
+        outer edge of an outline, which Tk still delivers to the item, counts
+        as a hit.
+        """
+        m = FocusArea.HIT_MARGIN
+        for fa in reversed(self.focus_areas):
+            x1, y1, x2, y2 = fa._coords
+            if x1 - m <= x <= x2 + m and y1 - m <= y <= y2 + m:
+                return fa
+            hx1, hy1, hx2, hy2 = fa._handle_coords
+            if hx1 - m <= x <= hx2 + m and hy1 - m <= y <= hy2 + m:
+                return fa
+        return None
+
     def on_canvas_press(self, event):
         """Start drawing a new focus area"""
-        print(f"Canvas pressed at ({event.x}, {event.y})")
+        logger.debug("Canvas pressed at (%s, %s)", event.x, event.y)
 
-        overlapping = self.canvas.find_overlapping(event.x, event.y, event.x, event.y)
-        for item in overlapping:
-            tags = self.canvas.gettags(item)
-            if "focus_area" in tags or "move_handle" in tags:
-                print("Clicked on existing focus area or move handle, not creating new one")
-                return
+        if self.find_focus_area_at(event.x, event.y) is not None:
+            logger.debug("Clicked on existing focus area or move handle, not creating new one")
+            return
 
         self.draw_start_x = event.x
         self.draw_start_y = event.y
 
+        self.canvas.coords(self.drawing_rect, event.x, event.y, event.x, event.y)
+        self.canvas.itemconfigure(self.drawing_rect, state="normal")
+        self.canvas.tag_raise(self.drawing_rect)
+
         self.set_transparent_for_editing(True)
 
     def on_canvas_drag(self, event):
@@ -696,47 +1024,54 @@ class Focus_AreaWindow:
         if self.draw_start_x == 0 and self.draw_start_y == 0:
             return
 
-        if self.drawing_rect:
-            self.canvas.delete(self.drawing_rect)
+        self._last_motion_event = event
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.root.after_idle(self._flush_motion)
+
+    def _flush_motion(self):
+        """Redraw the rubber-band rectangle for the latest drag event"""
+        if not self._motion_pending:
+            return
+        self._motion_pending = False
+        event = self._last_motion_event
+        self._last_motion_event = None
+
+        if self.draw_start_x == 0 and self.draw_start_y == 0:
+            return
 
         x1 = min(self.draw_start_x, event.x)
         y1 = min(self.draw_start_y, event.y)
         x2 = max(self.draw_start_x, event.x)
         y2 = max(self.draw_start_y, event.y)
 
-        self.drawing_rect = self.canvas.create_rectangle(
-            x1, y1, x2, y2,
-            fill=self.transparency_key,
-            outline=FocusArea.BORDER_COLOR,
-            width=FocusArea.BORDER_WIDTH,
-            tags="drawing"
-        )
+        self.canvas.coords(self.drawing_rect, x1, y1, x2, y2)
 
     def on_canvas_release(self, event):
         """Complete drawing the focus area"""
-        print(f"Canvas released at ({event.x}, {event.y})")
+        logger.debug("Canvas released at (%s, %s)", event.x, event.y)
 
         if self.draw_start_x == 0 and self.draw_start_y == 0:
             return
 
-        if self.drawing_rect:
-            x1 = min(self.draw_start_x, event.x)
-            y1 = min(self.draw_start_y, event.y)
-            x2 = max(self.draw_start_x, event.x)
-            y2 = max(self.draw_start_y, event.y)
+        self._flush_motion()
+
+        x1 = min(self.draw_start_x, event.x)
+        y1 = min(self.draw_start_y, event.y)
+        x2 = max(self.draw_start_x, event.x)
+        y2 = max(self.draw_start_y, event.y)
 
-            width = x2 - x1
-            height = y2 - y1
+        width = x2 - x1
+        height = y2 - y1
 
-            self.canvas.delete(self.drawing_rect)
-            self.drawing_rect = None
+        self.canvas.itemconfigure(self.drawing_rect, state="hidden")
 
-            if width >= FocusArea.MIN_SIZE and height >= FocusArea.MIN_SIZE:
-                focus_area = FocusArea(self, x1, y1, width, height)
-                self.focus_areas.append(focus_area)
-                print(f"Created focus area: {len(self.focus_areas)} total")
-            else:
-                print("Focus area too small, not created")
+        if width >= FocusArea.MIN_SIZE and height >= FocusArea.MIN_SIZE:
+            focus_area = FocusArea(self, x1, y1, width, height)
+            self.focus_areas.append(focus_area)
+            print(f"Created focus area: {len(self.focus_areas)} total")
+        else:
+            logger.debug("Focus area too small, not created")
 
         self.draw_start_x = 0
         self.draw_start_y = 0
@@ -745,15 +1080,7 @@ class Focus_AreaWindow:
 
     def on_mousewheel(self, event):
         """Change opacity with mouse wheel"""
-        delta = event.delta / 120
-
-        if delta > 0:
-            self.veil_opacity = min(1.0, self.veil_opacity + 0.01)
-        else:
-            self.veil_opacity = max(0.01, self.veil_opacity - 0.01)
-
-        print(f"Opacity changed to: {self.veil_opacity:.2f}")
-        self.update_opacity()
+        self.change_opacity(0.01 if event.delta > 0 else -0.01)
 
     def on_shift_press(self, event=None):
         """Handle Shift key press for peek through mode (default 55% opacity)"""
@@ -761,8 +1088,8 @@ class Focus_AreaWindow:
             print("Shift key pressed - activating peek through mode")
             self.is_peeking = True
             if self.veil_opacity > self.peek_through_opacity:
-                self.root.attributes('-alpha', self.peek_through_opacity)
-                print(f"Peek through opacity: {self.peek_through_opacity} ({round(self.peek_through_opacity * 100)}%)")
+                self.set_alpha(self.peek_through_opacity)
+                print(f"Peek through opacity: {self.peek_through_opacity} ({self._peek_pct}%)")
 
     def on_shift_release(self, event=None):
         """Handle Shift key release to restore normal opacity"""
@@ -770,7 +1097,7 @@ class Focus_AreaWindow:
             print("Shift key released - restoring normal opacity")
             self.is_peeking = False
             if not self.is_transparent_for_editing:
-                self.root.attributes('-alpha', self.veil_opacity)
+                self.set_alpha(self.veil_opacity)
                 print(f"Restored opacity: {self.veil_opacity}")
 
     def on_pause_shortcut(self, event=None):
@@ -791,18 +1118,31 @@ class Focus_AreaWindow:
         self.is_transparent_for_editing = transparent
 
         if transparent:
-            self.root.attributes('-alpha', self.peek_opacity)
-            print(f"Set to editing peek mode (opacity: {self.peek_opacity})")
+            self.set_alpha(self.peek_opacity)
+            logger.debug("Set to editing peek mode (opacity: %s)", self.peek_opacity)
         else:
             if not self.is_peeking:
                 self.update_opacity()
-                print(f"Restored normal opacity: {self.veil_opacity}")
+                logger.debug("Restored normal opacity: %s", self.veil_opacity)
+
+    def set_alpha(self, value):
+        """
+        Set the window alpha, skipping the call when the visible level is unchanged
+
+        Alpha is applied with 8-bit precision, so values that map to the same
+        byte produce no visible change.
+        """
+        alpha_byte = int(value * 255)
+        if alpha_byte == self._current_alpha_byte:
+            return
+        self._current_alpha_byte = alpha_byte
+        self._tk_call('wm', 'attributes', self._root_w, '-alpha', value)
 
     def update_opacity(self):
         """Update the window opacity"""
         self.last_user_opacity = self.veil_opacity
         if not self.is_peeking and not self.is_transparent_for_editing:
-            self.root.attributes('-alpha', self.veil_opacity)
+            self.set_alpha(self.veil_opacity)
 
     def toggle_pause(self, event=None):
         """
@@ -817,13 +1157,12 @@ class Focus_AreaWindow:
 
         if self.is_visible:
             print("Resuming - showing veil")
-            self.root.attributes('-alpha', self.veil_opacity)
+            self.set_alpha(self.veil_opacity)
             self.root.deiconify()
             self.root.lift()
             self.root.attributes('-topmost', True)
             self.root.focus_force()
-            self.root.attributes('-alpha', self.veil_opacity)
-            self.root.update()
+            self.root.update_idletasks()
             print(f"Restored opacity to: {self.veil_opacity}")
         else:
             print("Pausing - hiding veil")
@@ -854,59 +1193,58 @@ class Focus_AreaWindow:
         )
         return menu
 
-    def show_info_dialog(self, title, message):
-        """Show styled info dialog"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title(title)
-        dialog.configure(bg=self.MENU_BG)
-        dialog.resizable(False, False)
-        dialog.attributes('-topmost', True)
-        set_dark_title_bar(dialog)
-
-        dialog.update_idletasks()
-        width = 400
-        height = 150
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry(f'{width}x{height}+{x}+{y}')
+    def setup_styles(self):
+        """Configure the ttk styles used by the styled dialogs"""
+        style = ttk.Style(self.root)
+        style.theme_use('clam')
 
-        msg_label = tk.Label(
-            dialog,
-            text=message,
-            bg=self.MENU_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            wraplength=350,
-            justify=tk.LEFT,
-            padx=20,
-            pady=20
-        )
-        msg_label.pack(expand=True, fill=tk.BOTH)
+        style.configure('Dark.TFrame', background=self.MENU_BG)
 
-        btn_frame = tk.Frame(dialog, bg=self.MENU_BG)
-        btn_frame.pack(pady=10)
+        style.configure('Dark.TLabel', background=self.MENU_BG, foreground=self.MENU_FG, font=_FONT_10)
+        style.configure('Warning.Dark.TLabel', foreground="#FFA500")
+        style.configure('Error.Dark.TLabel', foreground="#FF4444")
 
-        ok_btn = tk.Button(
-            btn_frame,
-            text="OK",
-            command=dialog.destroy,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            padx=30,
-            pady=5,
+        style.configure(
+            'Dark.TButton',
+            background=self.MENU_ACTIVE_BG,
+            foreground=self.MENU_FG,
+            font=_FONT_10,
             relief=tk.FLAT,
-            cursor="hand2",
-            activebackground=self.MENU_ACTIVE_BG,
-            activeforeground=self.MENU_FG
+            borderwidth=0,
+            focuscolor=self.MENU_ACTIVE_BG
+        )
+        style.map(
+            'Dark.TButton',
+            background=[('active', self.MENU_ACTIVE_BG)],
+            foreground=[('active', self.MENU_FG)]
         )
-        ok_btn.pack()
 
-        dialog.grab_set()
-        dialog.wait_window()
+        style.configure(
+            'Dark.TEntry',
+            fieldbackground=self.MENU_ACTIVE_BG,
+            foreground=self.MENU_FG,
+            insertcolor=self.MENU_FG,
+            bordercolor=self.MENU_ACTIVE_BG,
+            lightcolor=self.MENU_ACTIVE_BG,
+            darkcolor=self.MENU_ACTIVE_BG
+        )
+        style.configure('Error.Dark.TEntry', fieldbackground="#4B2B2B")
 
-    def show_warning_dialog(self, title, message):
-        """Show styled warning dialog"""
+    def _build_dialog(self, title, message, label_style, buttons, height=150, entry_var=None):
+        """
+        Build a styled dialog window with a message and a row of buttons
+
+        Args:
+            title: Window title
+            message: Message text
+            label_style: ttk style name for the message label
+            buttons: List of (text, command) pairs; a None command closes the dialog
+            height: Dialog height in pixels
+            entry_var: Optional StringVar; when given, an entry field is added below the message
+
+        Returns:
+            tuple: (dialog, entry) where entry is None if no entry field was requested
+        """
         dialog = tk.Toplevel(self.root)
         dialog.title(title)
         dialog.configure(bg=self.MENU_BG)
@@ -914,289 +1252,236 @@ class Focus_AreaWindow:
         dialog.attributes('-topmost', True)
         set_dark_title_bar(dialog)
 
-        dialog.update_idletasks()
-        width = 400
-        height = 150
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry(f'{width}x{height}+{x}+{y}')
+        dialog.geometry(self._centered_geom(400, height, self._screen_w, self._screen_h))
 
-        msg_label = tk.Label(
+        msg_label = ttk.Label(
             dialog,
             text=message,
-            bg=self.MENU_BG,
-            fg="#FFA500",
-            font=("Segoe UI", 10),
+            style=label_style,
             wraplength=350,
             justify=tk.LEFT,
-            padx=20,
-            pady=20
+            padding=(20, 20 if entry_var is None else 10)
         )
-        msg_label.pack(expand=True, fill=tk.BOTH)
 
-        btn_frame = tk.Frame(dialog, bg=self.MENU_BG)
-        btn_frame.pack(pady=10)
+        entry = None
+        if entry_var is None:
+            msg_label.pack(expand=True, fill=tk.BOTH)
+        else:
+            msg_label.pack()
+
+            entry_frame = ttk.Frame(dialog, style='Dark.TFrame')
+            entry_frame.pack(pady=10)
+
+            entry = ttk.Entry(
+                entry_frame,
+                textvariable=entry_var,
+                style='Dark.TEntry',
+                font=_FONT_11,
+                width=10,
+                justify=tk.CENTER
+            )
+            entry.pack(padx=20)
+            entry.select_range(0, tk.END)
+            entry.focus()
+
+        btn_frame = ttk.Frame(dialog, style='Dark.TFrame')
+        btn_frame.pack(pady=10 if entry is None else 15)
+
+        for index, (text, command) in enumerate(buttons):
+            btn = ttk.Button(
+                btn_frame,
+                text=text,
+                command=command or dialog.destroy,
+                style='Dark.TButton',
+                padding=(30 if index == 0 else 20, 5),
+                cursor="hand2"
+            )
+            if len(buttons) == 1:
+                btn.pack()
+            else:
+                btn.pack(side=tk.LEFT, padx=5)
 
-        ok_btn = tk.Button(
-            btn_frame,
-            text="OK",
-            command=dialog.destroy,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            padx=30,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2",
-            activebackground=self.MENU_ACTIVE_BG,
-            activeforeground=self.MENU_FG
-        )
-        ok_btn.pack()
+        return dialog, entry
+
+    def _run_dialog(self, dialog, on_result):
+        """
+        Make a dialog modal
 
+        Without on_result this blocks in wait_window until the dialog closes.
+        With on_result it returns immediately; the dialog's buttons report the
+        result through the callback instead.
+        """
         dialog.grab_set()
-        dialog.wait_window()
+        if on_result is None:
+            dialog.wait_window()
+
+    def _show_message_dialog(self, title, message, label_style, on_result):
+        """Show a styled single-button message dialog"""
+        def on_ok():
+            dialog.destroy()
+            if on_result is not None:
+                on_result(None)
+
+        dialog, _ = self._build_dialog(title, message, label_style, [("OK", on_ok)])
+        dialog.protocol("WM_DELETE_WINDOW", on_ok)
+        self._run_dialog(dialog, on_result)
+
+    def show_info_dialog(self, title, message, on_result=None):
+        """Show styled info dialog"""
+        self._show_message_dialog(title, message, 'Dark.TLabel', on_result)
+
+    def show_warning_dialog(self, title, message, on_result=None):
+        """Show styled warning dialog"""
+        self._show_message_dialog(title, message, 'Warning.Dark.TLabel', on_result)
 
-    def show_error_dialog(self, title, message):
+    def show_error_dialog(self, title, message, on_result=None):
         """Show styled error dialog"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title(title)
-        dialog.configure(bg=self.MENU_BG)
-        dialog.resizable(False, False)
-        dialog.attributes('-topmost', True)
-        set_dark_title_bar(dialog)
-
-        dialog.update_idletasks()
-        width = 400
-        height = 150
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry(f'{width}x{height}+{x}+{y}')
-
-        msg_label = tk.Label(
-            dialog,
-            text=message,
-            bg=self.MENU_BG,
-            fg="#FF4444",
-            font=("Segoe UI", 10),
-            wraplength=350,
-            justify=tk.LEFT,
-            padx=20,
-            pady=20
-        )
-        msg_label.pack(expand=True, fill=tk.BOTH)
-
-        btn_frame = tk.Frame(dialog, bg=self.MENU_BG)
-        btn_frame.pack(pady=10)
-
-        ok_btn = tk.Button(
-            btn_frame,
-            text="OK",
-            command=dialog.destroy,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            padx=30,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2",
-            activebackground=self.MENU_ACTIVE_BG,
-            activeforeground=self.MENU_FG
-        )
-        ok_btn.pack()
+        self._show_message_dialog(title, message, 'Error.Dark.TLabel', on_result)
 
-        dialog.grab_set()
-        dialog.wait_window()
+    def show_confirm_dialog(self, title, message, on_result=None):
+        """
+        Show styled confirmation dialog - returns True if OK clicked
 
-    def show_confirm_dialog(self, title, message):
-        """Show styled confirmation dialog - returns True if OK clicked"""
+        If on_result is given the dialog does not block: this returns None and
+        on_result(True/False) is called once the dialog closes.
+        """
         result = [False]
 
-        dialog = tk.Toplevel(self.root)
-        dialog.title(title)
-        dialog.configure(bg=self.MENU_BG)
-        dialog.resizable(False, False)
-        dialog.attributes('-topmost', True)
-        set_dark_title_bar(dialog)
-
-        dialog.update_idletasks()
-        width = 400
-        height = 150
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry(f'{width}x{height}+{x}+{y}')
-
-        msg_label = tk.Label(
-            dialog,
-            text=message,
-            bg=self.MENU_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            wraplength=350,
-            justify=tk.LEFT,
-            padx=20,
-            pady=20
-        )
-        msg_label.pack(expand=True, fill=tk.BOTH)
-
-        btn_frame = tk.Frame(dialog, bg=self.MENU_BG)
-        btn_frame.pack(pady=10)
-
-        def on_ok():
-            result[0] = True
+        def finish(value):
+            result[0] = value
             dialog.destroy()
+            if on_result is not None:
+                on_result(value)
 
-        def on_cancel():
-            result[0] = False
-            dialog.destroy()
-
-        ok_btn = tk.Button(
-            btn_frame,
-            text="OK",
-            command=on_ok,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            padx=30,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2",
-            activebackground=self.MENU_ACTIVE_BG,
-            activeforeground=self.MENU_FG
+        dialog, _ = self._build_dialog(
+            title, message, 'Dark.TLabel',
+            [("OK", lambda: finish(True)), ("Cancel", lambda: finish(False))]
         )
-        ok_btn.pack(side=tk.LEFT, padx=5)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: finish(False))
+        self._run_dialog(dialog, on_result)
 
-        cancel_btn = tk.Button(
-            btn_frame,
-            text="Cancel",
-            command=on_cancel,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            padx=20,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2",
-            activebackground=self.MENU_ACTIVE_BG,
-            activeforeground=self.MENU_FG
-        )
-        cancel_btn.pack(side=tk.LEFT, padx=5)
-
-        dialog.grab_set()
-        dialog.wait_window()
+        if on_result is None:
+            return result[0]
 
-        return result[0]
+    def show_input_dialog(self, title, message, initial_value, min_val, max_val, on_result=None):
+        """
+        Show styled input dialog - returns integer or None
 
-    def show_input_dialog(self, title, message, initial_value, min_val, max_val):
-        """Show styled input dialog - returns integer or None"""
+        If on_result is given the dialog does not block: this returns None and
+        on_result(value) is called once the dialog closes, with None on cancel.
+        """
         result: list[int | None] = [None]
-
-        dialog = tk.Toplevel(self.root)
-        dialog.title(title)
-        dialog.configure(bg=self.MENU_BG)
-        dialog.resizable(False, False)
-        dialog.attributes('-topmost', True)
-        set_dark_title_bar(dialog)
-
-        dialog.update_idletasks()
-        width = 400
-        height = 180
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry(f'{width}x{height}+{x}+{y}')
-
-        msg_label = tk.Label(
-            dialog,
-            text=message,
-            bg=self.MENU_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            wraplength=350,
-            justify=tk.LEFT,
-            padx=20,
-            pady=10
-        )
-        msg_label.pack()
-
-        entry_frame = tk.Frame(dialog, bg=self.MENU_BG)
-        entry_frame.pack(pady=10)
-
         entry_var = tk.StringVar(value=str(initial_value))
-        entry = tk.Entry(
-            entry_frame,
-            textvariable=entry_var,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 11),
-            insertbackground=self.MENU_FG,
-            relief=tk.FLAT,
-            width=10,
-            justify=tk.CENTER
-        )
-        entry.pack(padx=20)
-        entry.select_range(0, tk.END)
-        entry.focus()
 
-        btn_frame = tk.Frame(dialog, bg=self.MENU_BG)
-        btn_frame.pack(pady=15)
+        def finish(value):
+            result[0] = value
+            dialog.destroy()
+            if on_result is not None:
+                on_result(value)
 
         def on_ok():
             try:
                 value = int(entry_var.get())
                 if min_val <= value <= max_val:
-                    result[0] = value
-                    dialog.destroy()
+                    finish(value)
                 else:
-                    entry.config(bg="#4B2B2B")
-                    dialog.after(200, lambda: entry.config(bg=self.MENU_ACTIVE_BG))
+                    self._flash_entry_error(entry)
             except ValueError:
-                entry.config(bg="#4B2B2B")
-                dialog.after(200, lambda: entry.config(bg=self.MENU_ACTIVE_BG))
+                self._flash_entry_error(entry)
 
-        def on_cancel():
-            result[0] = None
-            dialog.destroy()
+        dialog, entry = self._build_dialog(
+            title, message, 'Dark.TLabel',
+            [("OK", on_ok), ("Cancel", lambda: finish(None))],
+            height=180,
+            entry_var=entry_var
+        )
+        entry.bind('<Return>', lambda event: on_ok())
+        dialog.protocol("WM_DELETE_WINDOW", lambda: finish(None))
+        self._run_dialog(dialog, on_result)
+
+        if on_result is None:
+            return result[0]
+
+    def _flash_entry_error(self, entry):
+        """Show an entry in the error style for 200ms, restarting the timer on repeat"""
+        if self._error_after_id is not None:
+            self.root.after_cancel(self._error_after_id)
+        entry.configure(style='Error.Dark.TEntry')
+        self._error_entry = entry
+        self._error_after_id = self.root.after(200, self._clear_error)
+
+    def _clear_error(self):
+        """Restore the normal entry style after an error flash"""
+        entry = self._error_entry
+        self._error_after_id = None
+        self._error_entry = None
+        if entry is not None and entry.winfo_exists():
+            entry.configure(style='Dark.TEntry')
+
+    def _ensure_main_menu(self):
+        """
+        Build the main context menu on first use
 
-        def on_enter(event):
-            on_ok()
+        The menu is kept for the lifetime of the window; show_main_menu only
+        updates the labels that depend on the current state.
+        """
+        if self._main_menu is not None:
+            return
 
-        entry.bind('<Return>', on_enter)
+        menu = self.create_styled_menu(self.root)
 
-        ok_btn = tk.Button(
-            btn_frame,
-            text="OK",
-            command=on_ok,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            padx=30,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2",
-            activebackground=self.MENU_ACTIVE_BG,
-            activeforeground=self.MENU_FG
-        )
-        ok_btn.pack(side=tk.LEFT, padx=5)
+        menu.add_command(label="Pause (Ctrl+Shift+X)", command=self.toggle_pause)
+        self._pause_idx = menu.index(tk.END)
+        menu.add_separator()
 
-        cancel_btn = tk.Button(
-            btn_frame,
-            text="Cancel",
-            command=on_cancel,
-            bg=self.MENU_ACTIVE_BG,
-            fg=self.MENU_FG,
-            font=("Segoe UI", 10),
-            padx=20,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2",
-            activebackground=self.MENU_ACTIVE_BG,
-            activeforeground=self.MENU_FG
-        )
-        cancel_btn.pack(side=tk.LEFT, padx=5)
+        self._color_menu = self.create_styled_menu(menu)
+        self._color_menu.add_command(label="Choose Color...", command=self.choose_color)
+        self._color_menu.add_command(label="Reset to Black", command=self.reset_to_black)
+        menu.add_cascade(label="Color", menu=self._color_menu)
+
+        self._opacity_menu = self.create_styled_menu(menu)
+        self._opacity_menu.add_command(label="Set Opacity", command=self.set_opacity_dialog)
+        self._opacity_current_idx = self._opacity_menu.index(tk.END)
+        self._opacity_menu.add_separator()
+        self._opacity_menu.add_command(label="Set as Default", command=self.set_default_opacity)
+        menu.add_cascade(label="Opacity", menu=self._opacity_menu)
+
+        self._peek_menu = self.create_styled_menu(menu)
+        self._peek_menu.add_command(label="Set Peek Through Opacity", command=self.set_peek_through_opacity_dialog)
+        self._peek_current_idx = self._peek_menu.index(tk.END)
+        self._peek_menu.add_separator()
+        self._peek_menu.add_command(label="Set as Default", command=self.set_default_peek_through_opacity)
+        menu.add_cascade(label="Peek Through Opacity", menu=self._peek_menu)
 
-        dialog.grab_set()
-        dialog.wait_window()
+        menu.add_separator()
+        menu.add_command(label="Delete All Focus Areas", command=self.delete_all_focus_areas)
+        self._delete_all_idx = menu.index(tk.END)
 
-        return result[0]
+        menu.add_separator()
+        menu.add_command(label="Save Configuration", command=self.save_config)
+        menu.add_command(label="Load Configuration", command=lambda: self.load_config(show_message=True))
+
+        menu.add_separator()
+        menu.add_command(label="Quick Start Guide", command=self.show_quick_start)
+        menu.add_command(label="About", command=self.show_about)
+
+        menu.add_separator()
+        menu.add_command(label="Show Console", command=self.toggle_console)
+        self._console_idx = menu.index(tk.END)
+
+        menu.add_separator()
+        menu.add_command(label="Exit", command=self.quit_application)
+
+        self._main_menu = menu
+        self._menu_labels = {}
+
+    def _set_menu_label(self, menu, index, label):
+        """Update a menu entry label, skipping the Tk call if it is unchanged"""
+        key = (str(menu), index)
+        if self._menu_labels.get(key) == label:
+            return
+        menu.entryconfigure(index, label=label)
+        self._menu_labels[key] = label
 
     def show_main_menu(self, event):
         """Show the main context menu"""
@@ -1207,59 +1492,41 @@ class Focus_AreaWindow:
 
         print("Showing main menu")
 
-        menu = self.create_styled_menu(self.root)
+        self._ensure_main_menu()
+        menu = self._main_menu
 
         pause_text = "Resume" if not self.is_visible else "Pause (Ctrl+Shift+X)"
-        menu.add_command(label=pause_text, command=self.toggle_pause)
-        menu.add_separator()
-
-        color_menu = self.create_styled_menu(menu)
-        color_menu.add_command(label="Choose Color...", command=self.choose_color)
-        color_menu.add_command(label="Reset to Black", command=self.reset_to_black)
-        menu.add_cascade(label="Color", menu=color_menu)
-
-        opacity_menu = self.create_styled_menu(menu)
-        opacity_menu.add_command(label=f"Set Opacity (Current: {round(self.veil_opacity * 100)}%)", command=self.set_opacity_dialog)
-        opacity_menu.add_separator()
-        opacity_menu.add_command(label="Set as Default", command=self.set_default_opacity)
-        menu.add_cascade(label="Opacity", menu=opacity_menu)
+        self._set_menu_label(menu, self._pause_idx, pause_text)
 
-        peek_opacity_menu = self.create_styled_menu(menu)
-        peek_opacity_menu.add_command(label=f"Set Peek Through Opacity (Current: {round(self.peek_through_opacity * 100)}%)", command=self.set_peek_through_opacity_dialog)
-        peek_opacity_menu.add_separator()
-        peek_opacity_menu.add_command(label="Set as Default", command=self.set_default_peek_through_opacity)
-        menu.add_cascade(label="Peek Through Opacity", menu=peek_opacity_menu)
-
-        menu.add_separator()
-        menu.add_command(
-            label=f"Delete All Focus Areas ({len(self.focus_areas)})",
-            command=self.delete_all_focus_areas
+        self._set_menu_label(
+            self._opacity_menu, self._opacity_current_idx,
+            f"Set Opacity (Current: {self._opacity_pct}%)"
+        )
+        self._set_menu_label(
+            self._peek_menu, self._peek_current_idx,
+            f"Set Peek Through Opacity (Current: {self._peek_pct}%)"
         )
 
-        menu.add_separator()
-        menu.add_command(label="Save Configuration", command=self.save_config)
-        menu.add_command(label="Load Configuration", command=lambda: self.load_config(show_message=True))
-
-        menu.add_separator()
-        menu.add_command(label="Quick Start Guide", command=self.show_quick_start)
-        menu.add_command(label="About", command=self.show_about)
+        self._set_menu_label(
+            menu, self._delete_all_idx,
+            f"Delete All Focus Areas ({len(self.focus_areas)})"
+        )
 
-        menu.add_separator()
         console_text = "Hide Console" if self.console_visible else "Show Console"
-        menu.add_command(label=console_text, command=self.toggle_console)
-
-        menu.add_separator()
-        menu.add_command(label="Exit", command=self.quit_application)
+        self._set_menu_label(menu, self._console_idx, console_text)
 
-        try:
-            menu.post(event.x_root, event.y_root)
-        except:
-            menu.post(event.x, event.y)
+        x = getattr(event, 'x_root', None)
+        y = getattr(event, 'y_root', None)
+        if x is None or y is None:
+            x, y = event.x, event.y
+        menu.post(x, y)
 
     def choose_color(self):
         """Open color chooser dialog"""
         print("Opening color chooser...")
 
+        from tkinter import colorchooser
+
         color = colorchooser.askcolor(
             color=self.veil_color,
             title="Choose Veil Color"
@@ -1276,6 +1543,10 @@ class Focus_AreaWindow:
                 )
                 return
 
+            if new_color == self.veil_color.upper():
+                print("Veil color unchanged")
+                return
+
             self.veil_color = new_color
             print(f"Veil color changed to: {self.veil_color}")
             self.root.configure(bg=self.veil_color)
@@ -1283,6 +1554,10 @@ class Focus_AreaWindow:
 
     def reset_to_black(self):
         """Reset to black color and full opacity"""
+        if self.veil_color == "#000000" and self.veil_opacity == 1.0:
+            print("Already opaque black")
+            return
+
         print("Resetting to opaque black")
         self.veil_color = "#000000"
         self.veil_opacity = 1.0
@@ -1291,16 +1566,30 @@ class Focus_AreaWindow:
         self.update_opacity()
 
     def change_opacity(self, delta):
-        """Change opacity by delta"""
+        """
+        Change opacity by delta
+
+        Deltas arriving in quick succession are accumulated and applied once
+        when Tk becomes idle.
+        """
+        self._pending_delta += delta
+        if not self._delta_scheduled:
+            self._delta_scheduled = True
+            self.root.after_idle(self._flush_opacity)
+
+    def _flush_opacity(self):
+        """Apply the accumulated opacity delta in a single window update"""
+        delta = self._pending_delta
+        self._pending_delta = 0.0
+        self._delta_scheduled = False
+
         self.veil_opacity = max(0.01, min(1.0, self.veil_opacity + delta))
-        print(f"Opacity changed to: {self.veil_opacity:.2f}")
-        self.last_user_opacity = self.veil_opacity
-        if not self.is_peeking and not self.is_transparent_for_editing:
-            self.root.attributes('-alpha', self.veil_opacity)
+        logger.debug("Opacity changed to: %.2f", self.veil_opacity)
+        self.update_opacity()
 
     def set_opacity_dialog(self):
         """Show dialog to set opacity percentage"""
-        current_percent = round(self.veil_opacity * 100)
+        current_percent = self._opacity_pct
 
         result = self.show_input_dialog(
             "Set Opacity",
@@ -1315,14 +1604,14 @@ class Focus_AreaWindow:
             print(f"Opacity set to: {result}%")
             self.last_user_opacity = self.veil_opacity
             if not self.is_peeking and not self.is_transparent_for_editing:
-                self.root.attributes('-alpha', self.veil_opacity)
+                self.set_alpha(self.veil_opacity)
 
     def set_default_opacity(self):
         """Save current opacity as default in config file"""
-        opacity_percent = round(self.veil_opacity * 100)
+        opacity_percent = self._opacity_pct
         print(f"Setting default opacity to: {opacity_percent}%")
 
-        self.save_config()
+        self.save_config(notify=False)
 
         self.show_info_dialog(
             "Default Opacity Set",
@@ -1332,13 +1621,13 @@ class Focus_AreaWindow:
     def change_peek_through_opacity(self, delta):
         """Change peek through opacity by delta"""
         self.peek_through_opacity = max(0.01, min(1.0, self.peek_through_opacity + delta))
-        print(f"Peek through opacity changed to: {self.peek_through_opacity:.2f}")
+        logger.debug("Peek through opacity changed to: %.2f", self.peek_through_opacity)
         if self.is_peeking:
-            self.root.attributes('-alpha', self.peek_through_opacity)
+            self.set_alpha(self.peek_through_opacity)
 
     def set_peek_through_opacity_dialog(self):
         """Show dialog to set peek through opacity percentage"""
-        current_percent = round(self.peek_through_opacity * 100)
+        current_percent = self._peek_pct
 
         result = self.show_input_dialog(
             "Set Peek Through Opacity",
@@ -1352,14 +1641,14 @@ class Focus_AreaWindow:
             self.peek_through_opacity = result / 100.0
             print(f"Peek through opacity set to: {result}%")
             if self.is_peeking:
-                self.root.attributes('-alpha', self.peek_through_opacity)
+                self.set_alpha(self.peek_through_opacity)
 
     def set_default_peek_through_opacity(self):
         """Save current peek through opacity as default in config file"""
-        opacity_percent = round(self.peek_through_opacity * 100)
+        opacity_percent = self._peek_pct
         print(f"Setting default peek through opacity to: {opacity_percent}%")
 
-        self.save_config()
+        self.save_config(notify=False)
 
         self.show_info_dialog(
             "Default Peek Through Opacity Set",
@@ -1384,8 +1673,13 @@ class Focus_AreaWindow:
         self.focus_areas.clear()
         print("All focus areas deleted")
 
-    def save_config(self):
-        """Save current configuration to file"""
+    def save_config(self, notify=True):
+        """
+        Save current configuration to file
+
+        Args:
+            notify: Show the "Saved" dialog once the file has been written
+        """
         print(f"Saving configuration to: {self.config_file}")
 
         config = {
@@ -1393,17 +1687,59 @@ class Focus_AreaWindow:
             'veil_opacity': self.veil_opacity,
             'peek_through_opacity': self.peek_through_opacity,
             'show_quick_start_on_startup': self.show_quick_start_on_startup,
-            'focus_areas': [fa.get_coords() for fa in self.focus_areas]
+            'focus_areas_packed': _pack_coords(fa.get_coords() for fa in self.focus_areas)
         }
 
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            print("Configuration saved successfully")
-            self.show_info_dialog("Saved", "Configuration saved successfully!")
+            data = _encode_config(config)
         except Exception as e:
             print(f"Error saving configuration: {e}")
             self.show_error_dialog("Error", f"Failed to save configuration:\n{e}")
+            return
+
+        with self._config_slot_lock:
+            self._pending_config = (data, notify)
+            if self._config_writer_running:
+                return
+            self._config_writer_running = True
+
+        threading.Thread(target=self._write_config).start()
+
+    def _write_config(self):
+        """
+        Write queued configurations to disk (runs on a background thread)
+
+        Only the most recent payload is kept, so back-to-back saves are written
+        in order and the file always ends up holding the latest configuration.
+        """
+        while True:
+            with self._config_slot_lock:
+                pending = self._pending_config
+                self._pending_config = None
+                if pending is None:
+                    self._config_writer_running = False
+                    return
+
+            data, notify = pending
+            try:
+                _atomic_write(self.config_file, data)
+            except Exception as e:
+                print(f"Error saving configuration: {e}")
+                self._call_in_main_thread(
+                    self.show_error_dialog, "Error", f"Failed to save configuration:\n{e}"
+                )
+                continue
+
+            print("Configuration saved successfully")
+            if notify:
+                self._call_in_main_thread(self.show_info_dialog, "Saved", "Configuration saved successfully!")
+
+    def _call_in_main_thread(self, callback, *args):
+        """Schedule a callback on the Tk event loop from a worker thread"""
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
 
     def load_config(self, show_message=False):
         """Load configuration from file"""
@@ -1414,9 +1750,16 @@ class Focus_AreaWindow:
             return
 
         try:
+            import json
+
             with open(self.config_file, 'r') as f:
                 config = json.load(f)
 
+            if 'focus_areas_packed' in config:
+                new_coords = _unpack_coords(config['focus_areas_packed'])
+            else:
+                new_coords = [coords for coords in config.get('focus_areas', []) if len(coords) == 4]
+
             self.veil_color = config.get('veil_color', '#0C0000')
             self.veil_opacity = config.get('veil_opacity', 1.0)
             self.peek_through_opacity = config.get('peek_through_opacity', 0.55)
@@ -1426,16 +1769,18 @@ class Focus_AreaWindow:
             self.canvas.configure(bg=self.veil_color)
             self.update_opacity()
 
-            self.delete_all_focus_areas()
-
-            for coords in config.get('focus_areas', []):
-                if len(coords) == 4:
-                    x1, y1, x2, y2 = coords
-                    width = x2 - x1
-                    height = y2 - y1
-                    focus_area = FocusArea(self, x1, y1, width, height)
+            for i, (x1, y1, x2, y2) in enumerate(new_coords):
+                if i < len(self.focus_areas):
+                    self.focus_areas[i].set_coords(x1, y1, x2, y2)
+                else:
+                    focus_area = FocusArea(self, x1, y1, x2 - x1, y2 - y1)
                     self.focus_areas.append(focus_area)
 
+            for focus_area in self.focus_areas[len(new_coords):]:
+                focus_area.delete()
+
+            self.canvas.tag_raise("move_handle")
+
             print(f"Configuration loaded: {len(self.focus_areas)} focus areas restored")
 
             if show_message:
@@ -1449,59 +1794,6 @@ class Focus_AreaWindow:
         """Show quick start guide"""
         print("Showing quick start guide")
 
-        guide_text = """Focus_Area - Quick Start Guide
-
-IMPORTANT TIP - START HERE:
-Press and hold SHIFT to temporarily see through the veil (55% transparency)
-This helps you see where to position your focus areas!
-
-HOW TO USE:
-- Click and drag on the dark area to create focus areas
-- Drag the VIOLET HANDLE (4px, top center, 12px above) to move focus areas
-- Drag edges or corners to resize focus areas
-- Right-click the violet handle to DELETE a focus area
-- Right-click the dimmed area to show menu
-- Double-click anywhere to pause/resume
-- Scroll mouse wheel to change opacity
-- Hold SHIFT key to peek through the veil temporarily
-- Look for Focus_Area in the system tray!
-
-DELETING FOCUS AREAS:
-- Right-click the violet move handle to delete instantly
-- Or click the violet handle first, then press Delete key
-- Or use menu: Delete All Focus Areas
-
-SYSTEM TRAY:
-- Click tray icon to show/hide the veil
-- Right-click tray icon for quick menu access
-- Access Quick Start and Exit from tray
-
-KEYBOARD SHORTCUTS:
-- Shift         : Hold to peek through (see underlying content)
-- Ctrl+Shift+X  : Pause (hide veil)
-- Escape        : Show menu
-- Delete        : Delete focus area (after clicking violet handle)
-
-MOUSE ACTIONS:
-- Left-click drag (empty area)    : Create focus area
-- Left-click drag (violet handle) : Move focus area
-- Left-click drag (edge/corner)   : Resize focus area
-- Right-click (violet handle)     : Delete focus area
-- Right-click (dimmed area)       : Show menu
-- Double-click                    : Pause/Resume
-- Mouse wheel                     : Change opacity
-
-TIP: Focus areas are transparent windows where
-you can see your actual content clearly while
-the rest of the screen remains dimmed.
-
-Look for the small violet circle (4px) on the TOP SIDE
-(centered horizontally, 12px above) - that's your move handle!
-
-PEEK THROUGH TIP: Hold Shift to temporarily make the veil
-more transparent (55%) so you can see where to position
-your focus areas!"""
-
         guide_window = tk.Toplevel(self.root)
         guide_window.title("Focus_Area - Quick Start")
         guide_window.geometry("550x650")
@@ -1516,14 +1808,14 @@ your focus areas!"""
             pady=20,
             bg="#2C2C2C",
             fg="white",
-            font=("Segoe UI", 10),
+            font=_FONT_10,
             relief=tk.FLAT,
             borderwidth=0,
             highlightthickness=0,
             insertbackground="white"
         )
         text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert('1.0', guide_text)
+        text_widget.insert('1.0', _QUICK_START_TEXT)
         text_widget.config(state=tk.DISABLED)
 
         bottom_frame = tk.Frame(guide_window, bg="#2C2C2C")
@@ -1572,8 +1864,6 @@ your focus areas!"""
         """Show about dialog"""
         print("Showing about dialog")
 
-        github_url = "https://github.com/Gabrieliam42"
-
         about_window = tk.Toplevel(self.root)
         about_window.title("About Focus_Area")
         about_window.configure(bg=self.MENU_BG)
@@ -1581,12 +1871,7 @@ your focus areas!"""
         about_window.attributes('-topmost', True)
         set_dark_title_bar(about_window)
 
-        about_window.update_idletasks()
-        width = 450
-        height = 300
-        x = (about_window.winfo_screenwidth() // 2) - (width // 2)
-        y = (about_window.winfo_screenheight() // 2) - (height // 2)
-        about_window.geometry(f'{width}x{height}+{x}+{y}')
+        about_window.geometry(self._centered_geom(450, 300, self._screen_w, self._screen_h))
 
         text_widget = tk.Text(
             about_window,
@@ -1595,7 +1880,7 @@ your focus areas!"""
             pady=20,
             bg=self.MENU_BG,
             fg=self.MENU_FG,
-            font=("Segoe UI", 10),
+            font=_FONT_10,
             relief=tk.FLAT,
             borderwidth=0,
             highlightthickness=0,
@@ -1603,28 +1888,20 @@ your focus areas!"""
         )
         text_widget.pack(fill=tk.BOTH, expand=True)
 
-        text_widget.insert('1.0', """Focus_Area for Windows
-Python Implementation
-Version: 1.0.0
-
-Developed by:
-Gabriel Mihai
-""")
+        text_widget.insert('1.0', _ABOUT_PRELUDE)
 
         link_start = text_widget.index('end-1c')
-        text_widget.insert('end', github_url)
+        text_widget.insert('end', _GITHUB_URL)
         link_end = text_widget.index('end-1c')
 
-        text_widget.insert('end', """
-
-Focus_Area helps you focus on your current
-task by dimming other screen areas.""")
+        text_widget.insert('end', _ABOUT_POSTLUDE)
 
         text_widget.tag_add("link", link_start, link_end)
         text_widget.tag_config("link", foreground="#5DADE2", underline=True)
 
         def open_link(event):
-            webbrowser.open(github_url)
+            import webbrowser
+            webbrowser.open(_GITHUB_URL)
 
         def on_link_enter(event):
             text_widget.config(cursor="hand2")
@@ -1647,7 +1924,7 @@ task by dimming other screen areas.""")
             command=about_window.destroy,
             bg=self.MENU_ACTIVE_BG,
             fg=self.MENU_FG,
-            font=("Segoe UI", 10),
+            font=_FONT_10,
             padx=30,
             pady=5,
             relief=tk.FLAT,
@@ -1661,7 +1938,15 @@ task by dimming other screen areas.""")
         """Exit the application"""
         print("Exiting Focus_Area...")
 
-        if self.show_confirm_dialog("Exit", "Are you sure you want to exit Focus_Area?"):
+        self.show_confirm_dialog(
+            "Exit",
+            "Are you sure you want to exit Focus_Area?",
+            on_result=self._finish_quit
+        )
+
+    def _finish_quit(self, confirmed):
+        """Close the application once the exit confirmation is answered"""
+        if confirmed:
             print("User confirmed exit")
             self.root.quit()
             self.root.destroy()
@@ -1686,6 +1971,54 @@ task by dimming other screen areas.""")
         self.root.mainloop()
 
 
+def _list_tree(root, max_depth=2, per_dir_limit=10):
+    """
+    Build an indented listing of a directory tree
+
+    Directories are visited depth-first (pre-order, like os.walk) with
+    os.scandir and are not descended into below max_depth.
+
+    Args:
+        root: Directory to list
+        max_depth: Deepest directory level to descend into
+        per_dir_limit: Maximum number of files shown per directory
+
+    Returns:
+        list: Output lines
+    """
+    lines = []
+    stack = [(root, 0)]
+
+    while stack:
+        path, depth = stack.pop()
+        lines.append(f"{'  ' * depth}{os.path.basename(path)}/")
+
+        dirs = []
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < max_depth:
+                            dirs.append(entry.path)
+                    else:
+                        files.append(entry.name)
+        except OSError as e:
+            lines.append(f"{'  ' * (depth + 1)}[unreadable: {e}]")
+            continue
+
+        stack.extend((dir_path, depth + 1) for dir_path in reversed(dirs))
+
+        sub_indent = '  ' * (depth + 1)
+        for name in files[:per_dir_limit]:
+            lines.append(f"{sub_indent}{name}")
+
+        if len(files) > per_dir_limit:
+            lines.append(f"{sub_indent}... and {len(files) - per_dir_limit} more files")
+
+    return lines
+
+
 def main():
     """Main entry point"""
     print("="*60)
@@ -1697,23 +2030,10 @@ def main():
     print(f"Current working directory: {cwd}")
     print()
 
-    print("Listing directory contents:")
-    for root, dirs, files in os.walk(cwd):
-        level = root.replace(cwd, '').count(os.sep)
-        indent = ' ' * 2 * level
-        print(f"{indent}{os.path.basename(root)}/")
-
-        sub_indent = ' ' * 2 * (level + 1)
-        for file in files[:10]:
-            print(f"{sub_indent}{file}")
-
-        if len(files) > 10:
-            print(f"{sub_indent}... and {len(files) - 10} more files")
-
-        if level > 2:
-            break
-
-    print()
+    if os.environ.get("FOCUS_AREA_DEBUG_LISTING"):
+        print("Listing directory contents:")
+        sys.stdout.write('\n'.join(_list_tree(cwd)) + '\n')
+        print()
 
     check_and_elevate_admin()
 